@@ -11,14 +11,24 @@ from supabase import Client, create_client
 
 from ..config.logfire_config import search_logger
 
+# Global client instance, shared for the lifetime of the process
+_supabase_client: Client | None = None
+
 
 def get_supabase_client() -> Client:
     """
-    Get a Supabase client instance.
+    Get the shared Supabase client instance, creating it on first use.
+
+    Reusing one client keeps its HTTP connections alive across requests
+    instead of paying for a new client and TLS handshake on every call.
 
     Returns:
         Supabase client instance
     """
+    global _supabase_client
+    if _supabase_client is not None:
+        return _supabase_client
+
     url = os.getenv("SUPABASE_URL")
     key = os.getenv("SUPABASE_SERVICE_KEY")
 
@@ -37,6 +47,7 @@ def get_supabase_client() -> Client:
             project_id = match.group(1)
             search_logger.info(f"Supabase client initialized - project_id={project_id}")
 
+        _supabase_client = client
         return client
     except Exception as e:
         search_logger.error(f"Failed to create Supabase client: {e}")
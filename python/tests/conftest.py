@@ -19,8 +19,10 @@ os.environ.setdefault("ARCHON_AGENTS_PORT", "8052")
 
 
 @pytest.fixture(autouse=True)
-def prevent_real_db_calls():
+def prevent_real_db_calls(monkeypatch):
     """Automatically prevent any real database calls in all tests."""
+    # Drop the cached Supabase client so each test sees its own mock
+    monkeypatch.setattr("src.server.services.client_manager._supabase_client", None)
     with patch("supabase.create_client") as mock_create:
         # Make create_client raise an error if called without our mock
         mock_create.side_effect = Exception("Real database calls are not allowed in tests!")